@@ -1,18 +1,15 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta, time
 from io import BytesIO
+from functools import lru_cache
+from types import MappingProxyType
+import hashlib
+import importlib.util
 import json
 
-# Optional deps for Google Sheets (we guard-import them)
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    HAS_GSHEETS = True
-except Exception:
-    HAS_GSHEETS = False
-
 st.set_page_config(page_title="Sprint Planner (All-in-One)", page_icon="🏃", layout="wide")
 st.title("🏃 Sprint Planner — All-in-One")
 
@@ -28,6 +25,7 @@ DEFAULT_PHASES = [
     ("Phase 8 - Taper & Peak 2", "Taper into outdoor peak"),
     ("Phase 9 - Post-season Reset", "Active recovery & reset")
 ]
+_FOCUS_BY_PHASE = dict(DEFAULT_PHASES)
 
 ROTATIONS = {
     "Mon": [
@@ -74,10 +72,71 @@ ROTATIONS = {
     ]
 }
 
+DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# ROTATIONS as a (7 days x 4 rotations) array so a whole season is one fancy-index gather
+ROT_ARR = np.array([ROTATIONS[d] for d in DAYS], dtype=object)
+
+_AUTO_TEMPLATES = {
+    5: {
+        "Mon": {"location": "Statina/Club", "minutes": 75},
+        "Tue": {"location": "Track", "minutes": 60},
+        "Wed": {"location": "Home (core)", "minutes": 60},
+        "Thu": {"location": "Papendal/Track", "minutes": 105},
+        "Fri": {"location": "Track", "minutes": 60}
+    },
+    4: {
+        "Mon": {"location": "Club/Track", "minutes": 75},
+        "Wed": {"location": "Home (core)", "minutes": 45},
+        "Thu": {"location": "Track", "minutes": 90},
+        "Fri": {"location": "Track", "minutes": 60}
+    },
+    6: {
+        "Mon": {"location": "Track", "minutes": 75},
+        "Tue": {"location": "Track", "minutes": 60},
+        "Wed": {"location": "Home (core)", "minutes": 60},
+        "Thu": {"location": "Track", "minutes": 105},
+        "Fri": {"location": "Track", "minutes": 60},
+        "Sat": {"location": "Track (optional)", "minutes": 90}
+    }
+}
+# Final prefix string per (sessions/week, day), formatted once at import
+_AUTO_PREFIXES = {
+    n: {day: f'(@ {t["location"]}, ~{t["minutes"]} min) — ' for day, t in days.items() if t["minutes"]}
+    for n, days in _AUTO_TEMPLATES.items()
+}
+
+def _time_prefix_auto(day, sessions_per_week):
+    return _AUTO_PREFIXES.get(sessions_per_week, _AUTO_PREFIXES[5]).get(day, "")
+
+SCHEDULE_COLUMNS = ["Week of", "Phase", "Focus", *DAYS, "Volume modifier"]
+
+# The only cfg fields that change the schedule; the cache key ignores name, PBs, etc.
+SCHEDULE_KEYS = ("season_start", "season_end", "peaks", "bike_km_per_day", "age", "schedule")
+
 def build_schedule(cfg):
+    # Streamlit reruns the whole script on every widget change; cache on a canonical
+    # JSON of the schedule fields (dicts aren't hashable) so an unchanged config skips
+    # the rebuild. Invalid configs raise inside the cached function, so they are never cached.
+    try:
+        return _build_schedule(json.dumps({k: cfg[k] for k in SCHEDULE_KEYS if k in cfg}, sort_keys=True))
+    except ValueError as e:
+        st.error(str(e))
+        return pd.DataFrame(columns=SCHEDULE_COLUMNS)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_schedule(cfg_json):
+    # st.cache_data hands every caller its own copy, so callers may mutate the result.
+    cfg = json.loads(cfg_json)
     start = datetime.strptime(cfg["season_start"], "%Y-%m-%d")
     end = datetime.strptime(cfg["season_end"], "%Y-%m-%d")
-    weeks = pd.date_range(start=start, end=end, freq="W-MON")
+    # Every Monday in [start, end]; same as pd.date_range(freq="W-MON") without the DateOffset walk
+    first_monday = start + timedelta(days=-start.weekday() % 7)
+    n_weeks = max((end - first_monday).days // 7 + 1, 0)
+    if n_weeks == 0:
+        raise ValueError("Season dates are inconsistent: the season must end after it starts "
+                         "and contain at least one Monday.")
+    weeks = pd.DatetimeIndex((np.datetime64(first_monday, "D")
+                              + np.arange(n_weeks) * np.timedelta64(7, "D")).astype("datetime64[ns]"))
 
     peak1 = datetime.strptime(cfg["peaks"]["indoor_peak_dates"][0], "%Y-%m-%d")
     peak2 = datetime.strptime(cfg["peaks"]["outdoor_peak_date"], "%Y-%m-%d")
@@ -94,11 +153,21 @@ def build_schedule(cfg):
         ("Phase 9 - Post-season Reset", peak2 + timedelta(days=1), end)
     ]
 
-    def phase_for(date):
-        for name, s, e in phases_cfg:
-            if s <= date <= e:
-                return name
-        return ""
+    # Phase i covers [bins[i], bins[i+1]). The outer edges are clamped so a late season
+    # start or an early season end simply leaves Phase 1 / Phase 9 empty.
+    bins = ([min(start, phases_cfg[0][2])]
+            + [s for _, s, _ in phases_cfg[1:]]
+            + [max(end, phases_cfg[-1][1]) + timedelta(days=1)])
+    bin_days = np.array(bins, dtype="datetime64[D]").astype(np.int64)
+    # searchsorted silently misassigns weeks on unsorted edges, so reject those configs first
+    if end < peak2 or not np.all(np.diff(bin_days) > 0):
+        raise ValueError("Peak dates are inconsistent: the season must end on or after the outdoor "
+                         "peak, and the outdoor peak must be more than 9 weeks after the indoor peak.")
+    # Integer phase id per week over int64 day ordinals: index of the last edge <= week,
+    # so -1 / 9 mean the week falls outside every phase.
+    week_days = weeks.values.astype("datetime64[D]").astype(np.int64)
+    phase_ids = np.searchsorted(bin_days, week_days, side="right") - 1
+    phase_names = np.array([name for name, _, _ in phases_cfg], dtype=object)
 
     bike_km_per_day = cfg.get("bike_km_per_day", 0)
     commute_factor = 0.9 if bike_km_per_day >= 30 else 1.0
@@ -111,89 +180,62 @@ def build_schedule(cfg):
     include_time_prefix = schedule_cfg.get("include_time_prefix", True)
     manual_slots = schedule_cfg.get("slots", {})
 
-    def _time_prefix_manual(slots):
-        parts = []
-        for s in slots:
-            t = f'{s.get("start","")}-{s.get("end","")} @ {s.get("location","")}'
-            parts.append(t)
-        return " + ".join(parts)
-
-    def _time_prefix_auto(day, sessions_per_week):
-        templates = {
-            5: {
-                "Mon": {"location": "Statina/Club", "minutes": 75},
-                "Tue": {"location": "Track", "minutes": 60},
-                "Wed": {"location": "Home (core)", "minutes": 60},
-                "Thu": {"location": "Papendal/Track", "minutes": 105},
-                "Fri": {"location": "Track", "minutes": 60}
-            },
-            4: {
-                "Mon": {"location": "Club/Track", "minutes": 75},
-                "Wed": {"location": "Home (core)", "minutes": 45},
-                "Thu": {"location": "Track", "minutes": 90},
-                "Fri": {"location": "Track", "minutes": 60}
-            },
-            6: {
-                "Mon": {"location": "Track", "minutes": 75},
-                "Tue": {"location": "Track", "minutes": 60},
-                "Wed": {"location": "Home (core)", "minutes": 60},
-                "Thu": {"location": "Track", "minutes": 105},
-                "Fri": {"location": "Track", "minutes": 60},
-                "Sat": {"location": "Track (optional)", "minutes": 90}
-            }
-        }
-        t = templates.get(sessions_per_week, templates[5]).get(day, None)
-        if not t or t["minutes"] == 0:
-            return ""
-        return f'(@ {t["location"]}, ~{t["minutes"]} min) — '
-
-    rows = []
-    for i, w in enumerate(weeks):
-        phase = phase_for(w)
-        if not phase:
-            continue
-        rot_idx = i % 4
-        focus = next((d for n,d in DEFAULT_PHASES if n == phase), "")
-        vol_mod = round(commute_factor * age_factor, 2)
-        if "Taper" in phase:
-            vol_mod = 0.5
-        if "Transition" in phase or "Post-season" in phase:
-            vol_mod = 0.4
-
-        day_cells = {}
-        for day in ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]:
-            base_text = ROTATIONS[day][rot_idx]
-            prefix = ""
-            if include_time_prefix:
-                if schedule_mode == "manual":
-                    slots = manual_slots.get(day, [])
-                    if slots:
-                        prefix = f"{_time_prefix_manual(slots)} — "
-                elif schedule_mode == "auto":
-                    prefix = _time_prefix_auto(day, sessions_per_week)
-            day_cells[day] = f"{prefix}{base_text}" if prefix else base_text
-
-        rows.append({
-            "Week of": w.strftime("%Y-%m-%d"),
-            "Phase": phase,
-            "Focus": focus,
-            "Mon": day_cells["Mon"],
-            "Tue": day_cells["Tue"],
-            "Wed": day_cells["Wed"],
-            "Thu": day_cells["Thu"],
-            "Fri": day_cells["Fri"],
-            "Sat": day_cells["Sat"],
-            "Sun": day_cells["Sun"],
-            "Volume modifier": vol_mod
-        })
-
-    return pd.DataFrame(rows)
-
-def df_to_excel_download(df, filename="plan.xlsx"):
+    rot_ids = np.arange(len(weeks)) % 4
+    keep = (phase_ids >= 0) & (phase_ids < len(phases_cfg))
+    ids = phase_ids[keep]
+    # Evaluate the modifier masks on the nine phase labels only, then gather per week by id
+    labels = pd.Index(phase_names)
+    phase_mods = np.select(
+        [labels.str.contains("Taper"), labels.str.contains("Transition|Post-season")],
+        [0.5, 0.4],
+        default=round(commute_factor * age_factor, 2)
+    )
+    day_matrix = ROT_ARR[:, rot_ids[keep]]  # shape (7, weeks kept)
+
+    # The time/location prefix only depends on the day, so format it once per day
+    # and broadcast it over the whole column.
+    prefixes = {}
+    for day in DAYS:
+        prefix = ""
+        if include_time_prefix:
+            if schedule_mode == "manual":
+                # Slots arrive preformatted from the UI as "HH:MM-HH:MM @ location"
+                if manual_slots.get(day):
+                    prefix = f"{manual_slots[day]} — "
+            elif schedule_mode == "auto":
+                prefix = _time_prefix_auto(day, sessions_per_week)
+        prefixes[day] = prefix
+    day_cols = {day: prefixes[day] + day_matrix[j] for j, day in enumerate(DAYS)}
+
+    phase_col = phase_names[ids]
+    return pd.DataFrame({
+        "Week of": weeks[keep].strftime("%Y-%m-%d"),
+        "Phase": phase_col,
+        "Focus": pd.Series(phase_col).map(_FOCUS_BY_PHASE).fillna(""),
+        **day_cols,
+        "Volume modifier": phase_mods[ids]
+    })
+
+def cached_excel(df, kind, serialize):
+    # Skip re-serialising when the frame is unchanged since the last export of this kind.
+    # Only the latest export per kind is kept, so session memory stays bounded.
+    h = hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).values.tobytes(), digest_size=8)
+    h.update("|".join(map(str, df.columns)).encode("utf-8"))
+    slot = f"xlsx_{kind}"
+    cached = st.session_state.get(slot)
+    if cached is None or cached[0] != h.hexdigest():
+        cached = (h.hexdigest(), serialize(df))
+        st.session_state[slot] = cached
+    return cached[1]
+
+def _plan_to_excel(df):
     output = BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
         df.to_excel(writer, index=False)
-    st.download_button("Download Excel", data=output.getvalue(), file_name=filename,
+    return output.getvalue()
+
+def df_to_excel_download(df, filename="plan.xlsx"):
+    st.download_button("Download Excel", data=cached_excel(df, "plan", _plan_to_excel), file_name=filename,
                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
 def json_download_button(cfg, filename="config.json"):
@@ -202,7 +244,12 @@ def json_download_button(cfg, filename="config.json"):
                        file_name=filename, mime="application/json")
 
 # ---------------- Race calendar helpers ---------------- #
+@lru_cache(maxsize=None)
 def taper_protocol(priority, peak_type):
+    # Cached, so hand out read-only views that callers can share safely
+    return MappingProxyType(_taper_protocol(priority, peak_type))
+
+def _taper_protocol(priority, peak_type):
     if priority == "A":
         return {
             "Volume change": "-40% to -60%",
@@ -230,36 +277,61 @@ def taper_protocol(priority, peak_type):
         "Notes": "Training race; prioritize learning"
     }
 
+TAPER_COLUMNS = {
+    "Volume change": "Taper: Volume",
+    "Intensity": "Taper: Intensity",
+    "Key sessions": "Taper: Key sessions",
+    "Strength": "Taper: Strength",
+    "Rest days": "Taper: Rest days",
+    "Notes": "Notes"
+}
+
 def calendar_to_excel(df_cal):
-    # Expand with taper columns
-    rows = []
-    for _, r in df_cal.iterrows():
-        p = taper_protocol(r["Priority (A/B/C)"], r.get("Peak type",""))
-        rows.append({
-            "Date": r["Date"],
-            "Meet": r["Meet"],
-            "Priority (A/B/C)": r["Priority (A/B/C)"],
-            "Events": r["Events"],
-            "Taper: Volume": p["Volume change"],
-            "Taper: Intensity": p["Intensity"],
-            "Taper: Key sessions": p["Key sessions"],
-            "Taper: Strength": p["Strength"],
-            "Taper: Rest days": p["Rest days"],
-            "Notes": p["Notes"]
-        })
-    out = pd.DataFrame(rows)
+    return cached_excel(df_cal, "calendar", _calendar_to_excel)
+
+def _calendar_to_excel(df_cal):
+    # Expand with taper columns. The protocol only depends on (priority, peak type), so
+    # build it once per distinct pair and merge it back instead of iterating the rows.
+    keys = ["Priority (A/B/C)", "Peak type"]
+    cal = df_cal.assign(**{"Peak type": df_cal.get("Peak type", "")})
+    pairs = cal[keys].drop_duplicates().reset_index(drop=True)
+    protocols = pd.DataFrame([taper_protocol(prio, peak) for prio, peak in pairs.itertuples(index=False)],
+                             columns=list(TAPER_COLUMNS)).rename(columns=TAPER_COLUMNS)
+    taper = pd.concat([pairs, protocols], axis=1)
+    out = cal.merge(taper, on=keys, how="left")[["Date", "Meet", "Priority (A/B/C)", "Events",
+                                                 *TAPER_COLUMNS.values()]]
     bio = BytesIO()
-    with pd.ExcelWriter(bio, engine="openpyxl") as w:
+    with pd.ExcelWriter(bio, engine="xlsxwriter") as w:
         out.to_excel(w, index=False, sheet_name="Race Calendar")
     return bio.getvalue()
 
 # ---------------- Google Sheets helpers ---------------- #
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+@st.cache_resource(show_spinner=False)
+def _load_gsheets():
+    # Optional deps for Google Sheets, only needed by the Athlete Log. Imported on first
+    # use (and cached across reruns) so the other tabs don't pay for google-auth at startup.
+    try:
+        import gspread
+        from google.oauth2.service_account import Credentials
+    except Exception:
+        return None
+    return gspread, Credentials
+
+def _has_gsheets():
+    # Only checks that the packages are installed; the import itself waits for first use
+    try:
+        return all(importlib.util.find_spec(m) is not None for m in ("gspread", "google.oauth2"))
+    except ImportError:
+        return False
+
 @st.cache_resource(show_spinner=False)
 def get_gspread_client_from_secrets():
-    if not HAS_GSHEETS:
+    gs = _load_gsheets()
+    if not gs:
         return None, "gspread/google-auth niet geïnstalleerd"
+    gspread, Credentials = gs
     if "gcp_service_account" not in st.secrets:
         return None, "st.secrets['gcp_service_account'] ontbreekt"
     try:
@@ -271,8 +343,10 @@ def get_gspread_client_from_secrets():
         return None, f"Fout bij secrets-auth: {e}"
 
 def get_gspread_client_from_upload(uploaded_json_file):
-    if not HAS_GSHEETS:
+    gs = _load_gsheets()
+    if not gs:
         return None, "gspread/google-auth niet geïnstalleerd", None
+    gspread, Credentials = gs
     try:
         info = json.loads(uploaded_json_file.getvalue().decode("utf-8"))
         creds = Credentials.from_service_account_info(info, scopes=SCOPES)
@@ -282,6 +356,7 @@ def get_gspread_client_from_upload(uploaded_json_file):
         return None, f"Fout bij JSON-upload-auth: {e}", None
 
 def open_sheet(client, sheet_id_or_url, worksheet_name):
+    gspread, _ = _load_gsheets()
     try:
         if sheet_id_or_url.startswith("http"):
             sh = client.open_by_url(sheet_id_or_url)
@@ -296,6 +371,40 @@ def open_sheet(client, sheet_id_or_url, worksheet_name):
     except Exception as e:
         return None, None, f"Kon sheet niet openen: {e}"
 
+def get_worksheet(client, account, sheet_id_or_url, worksheet_name):
+    # open_sheet costs two API round-trips, so keep the handle for the browser session.
+    # session_state (not st.cache_resource) so one user's credentials never serve another.
+    key = f"_ws|{account}|{sheet_id_or_url}|{worksheet_name}"
+    ws = st.session_state.get(key)
+    if ws is None:
+        _, ws, err = open_sheet(client, sheet_id_or_url, worksheet_name)
+        if err:
+            return None, err
+        st.session_state[key] = ws
+    return ws, None
+
+RECORDS_TTL_SECONDS = 60
+
+def fetch_records(client, account, sheet_id_or_url, worksheet_name):
+    # Every widget change reruns the script; keep the last read for a minute instead of
+    # hitting the Sheets API each time. Per session, like get_worksheet, so rows are only
+    # served to the session whose credentials read them. Errors are raised, never stored.
+    key = f"_records|{account}|{sheet_id_or_url}|{worksheet_name}"
+    hit = st.session_state.get(key)
+    now = datetime.now().timestamp()
+    if hit is not None and now - hit[0] < RECORDS_TTL_SECONDS:
+        return hit[1]
+    ws, err = get_worksheet(client, account, sheet_id_or_url, worksheet_name)
+    if err:
+        raise RuntimeError(err)
+    df = pd.DataFrame(ws.get_all_records())
+    st.session_state[key] = (now, df)
+    return df
+
+def clear_records():
+    for key in [k for k in st.session_state if str(k).startswith("_records|")]:
+        del st.session_state[key]
+
 # ---------------- UI Tabs ---------------- #
 tab1, tab2, tab3 = st.tabs(["Plan Generator", "Race Calendar", "Athlete Log"])
 
@@ -357,12 +466,12 @@ with tab1:
                     t2 = st.time_input(f"End {d}", end_default, key=f"end_{d}")
                     add = st.checkbox(f"Use {d}", True if d in ["Mon","Tue","Wed","Thu","Fri"] else False, key=f"use_{d}")
                     if add:
-                        manual_slots[d] = [ {"start": t1.strftime("%H:%M"), "end": t2.strftime("%H:%M"), "location": loc} ]
+                        manual_slots[d] = f'{t1.strftime("%H:%M")}-{t2.strftime("%H:%M")} @ {loc}'
                 else:
                     st.info("No default time")
                     add = st.checkbox(f"Use {d}", False, key=f"use_{d}")
                     if add:
-                        manual_slots[d] = []
+                        manual_slots[d] = ""
     else:
         st.markdown("**Auto schedule — sessions/week**")
         sessions_per_week = st.slider("Sessions per week", 3, 6, 5, 1)
@@ -389,7 +498,8 @@ with tab1:
             }
         }
         df = build_schedule(cfg)
-        st.success(f"Plan generated for {athlete_name}. Weeks: {len(df)}")
+        if not df.empty:  # build_schedule already reported why an empty plan came back
+            st.success(f"Plan generated for {athlete_name}. Weeks: {len(df)}")
         st.dataframe(df, use_container_width=True)
         df_to_excel_download(df, filename=f"{athlete_name.replace(' ','_')}_SprintPlan.xlsx")
         json_download_button(cfg, filename=f"{athlete_name.replace(' ','_')}_config.json")
@@ -419,6 +529,7 @@ with tab2:
 
 with tab3:
     st.subheader("Athlete Log → Google Sheets")
+    HAS_GSHEETS = _has_gsheets()
     if not HAS_GSHEETS:
         st.warning("gspread/google-auth niet geïnstalleerd. Voeg ze toe aan requirements en redeploy.")
     auth_mode = st.radio("Authenticatie", ["st.secrets (aanbevolen)", "JSON upload"], horizontal=True, index=0)
@@ -428,7 +539,8 @@ with tab3:
     client = None
     service_account_email = None
     if auth_mode == "st.secrets (aanbevolen)":
-        if HAS_GSHEETS:
+        # Tabs all run on every rerun, so only authenticate (and import gspread) once a sheet is set
+        if HAS_GSHEETS and sheet_id_or_url:
             client, err = get_gspread_client_from_secrets()
             if err:
                 st.error(err)
@@ -458,17 +570,21 @@ with tab3:
         submitted = st.form_submit_button("Submit")
 
     if submitted:
-        if not client:
-            st.error("Niet verbonden met Google Sheets. Stel je authenticatie in.")
-        elif not sheet_id_or_url or not worksheet_name:
+        if not sheet_id_or_url or not worksheet_name:
             st.error("Vul de Spreadsheet URL/ID en Worksheet naam in.")
+        elif not client:
+            st.error("Niet verbonden met Google Sheets. Stel je authenticatie in.")
         else:
-            _, ws, err = open_sheet(client, sheet_id_or_url, worksheet_name)
+            ws, err = get_worksheet(client, service_account_email, sheet_id_or_url, worksheet_name)
             if err:
                 st.error(err)
             else:
                 try:
-                    ws.append_row([date.strftime("%Y-%m-%d"), athlete, session, rpe, fatigue, notes])
+                    # USER_ENTERED lets Sheets parse the date (and numbers) server-side; the
+                    # free-text cells get a leading ' so they stay literal text, never formulas
+                    ws.append_row([date.strftime("%Y-%m-%d"), f"'{athlete}", session, rpe, fatigue, f"'{notes}"],
+                                  value_input_option="USER_ENTERED")
+                    clear_records()
                     st.success("Inzending opgeslagen in Google Sheets ✅")
                 except Exception as e:
                     st.error(f"Kon niet schrijven naar sheet: {e}")
@@ -476,24 +592,23 @@ with tab3:
     st.markdown("---")
     st.markdown("### Recent entries")
     if HAS_GSHEETS and client and sheet_id_or_url and worksheet_name:
-        _, ws, err = open_sheet(client, sheet_id_or_url, worksheet_name)
-        if not err:
-            try:
-                records = ws.get_all_records()
-                df = pd.DataFrame(records)
-                if not df.empty:
-                    c1, c2 = st.columns(2)
-                    with c1:
-                        who = st.text_input("Filter op atleet (optioneel)")
-                    with c2:
-                        last_n = st.number_input("Toon laatste N", min_value=5, max_value=500, value=50, step=5)
-                    if who:
-                        df = df[df["Athlete"].str.contains(who, case=False, na=False)]
-                    st.dataframe(df.tail(int(last_n)), use_container_width=True)
-                else:
-                    st.info("Nog geen data in het werkblad.")
-            except Exception as e:
-                st.error(f"Kon records niet lezen: {e}")
+        try:
+            df = fetch_records(client, service_account_email, sheet_id_or_url, worksheet_name)
+            if not df.empty:
+                c1, c2 = st.columns(2)
+                with c1:
+                    who = st.text_input("Filter op atleet (optioneel)")
+                with c2:
+                    last_n = st.number_input("Toon laatste N", min_value=5, max_value=500, value=50, step=5)
+                # Only scan a bounded tail of the history; literal match, no regex compile
+                window = df.tail(max(int(last_n) * 4, 500))
+                if who:
+                    window = window[window["Athlete"].astype(str).str.contains(who, case=False, na=False, regex=False)]
+                st.dataframe(window.tail(int(last_n)), use_container_width=True)
+            else:
+                st.info("Nog geen data in het werkblad.")
+        except Exception as e:
+            st.error(f"Kon records niet lezen: {e}")
 
 # Footer
 st.caption("© Sprint Planner — All-in-One | Streamlit app for coaches & athletes")